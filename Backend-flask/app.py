@@ -16,17 +16,34 @@ Notes:
 - Configure RPC endpoints in RPC_URLS dictionary (replace public RPCs with Alchemy/Infura for production).
 - Optional Solana support: `pip install solana` (app will use it if available).
 - Optional YAML support for chains config: `pip install pyyaml`.
+- Served by gevent workers (see gunicorn.conf.py); the stdlib is monkey-patched first thing so
+  requests/urllib3 sockets yield instead of blocking the worker.
 """
+from gevent import monkey
+monkey.patch_all()
+
+import gevent
 import os
 import time
-import json
+import random
+import re
 import logging
+import threading
 from functools import lru_cache
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from cachetools import TTLCache
 
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from gevent.pool import Group
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from eth_abi import decode as abi_decode, encode as abi_encode
 from web3 import Web3, HTTPProvider
 from web3.exceptions import BadFunctionCallOutput, ContractLogicError
 
@@ -45,54 +62,86 @@ try:
 except Exception:
     YAML_AVAILABLE = False
 
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson, used by jsonify and request.get_json.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype="application/json")
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
 # Log incoming requests (you asked where to put it — here is before_request)
 @app.before_request
 def log_request():
-    logger.info(f"Incoming request: {request.method} {request.path}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Incoming request: %s %s", request.method, request.path)
 
 # -------------------------
 # Config
 # -------------------------
 COINGECKO_API = "https://api.coingecko.com/api/v3"
+# Rate budgets are for the whole deployment. Buckets live in each worker process, so each
+# gets an equal share (gunicorn.conf.py exports its worker count as WEB_CONCURRENCY).
+RATE_LIMIT_WORKERS = max(1, int(os.environ.get("WEB_CONCURRENCY", "1")))
+COINGECKO_RATE_PER_MIN = float(os.environ.get("COINGECKO_RATE_PER_MIN", "30"))  # free tier limit
+COINGECKO_MAX_IDS = 180  # /coins/markets rejects longer id lists
+RPC_RATE_PER_MIN = float(os.environ.get("RPC_RATE_PER_MIN", "600"))  # per public RPC host
+
+# Built-in public endpoints. Only these are rate limited: RPC_* overrides and chains file
+# entries pointing elsewhere are usually keyed endpoints with their own quotas.
+PUBLIC_RPC_URLS: Dict[str, str] = {
+    "ethereum": "https://cloudflare-eth.com",
+    "bsc": "https://bsc-dataseed.binance.org/",
+    "polygon": "https://rpc.ankr.com/polygon",
+    "avax": "https://rpc.ankr.com/avalanche",
+    "arbitrum": "https://rpc.ankr.com/arbitrum",
+    "optimism": "https://rpc.ankr.com/optimism",
+    "fantom": "https://rpc.ankr.com/fantom",
+    "cronos": "https://evm.cronos.org",
+    # Solana uses a different SDK (optional)
+    "solana": "https://api.mainnet-beta.solana.com",
+}
+_PUBLIC_RPC_SET = {u.rstrip("/") for u in PUBLIC_RPC_URLS.values()}
 
 # Default RPC endpoints: will be merged with chains file (if provided)
 # Keep defaults non-destructive (same as your earlier code)
 RPC_URLS: Dict[str, str] = {
-    "ethereum": os.environ.get("RPC_ETH", "https://cloudflare-eth.com"),
-    "bsc": os.environ.get("RPC_BSC", "https://bsc-dataseed.binance.org/"),
-    "polygon": os.environ.get("RPC_POLYGON", "https://rpc.ankr.com/polygon"),
-    "avax": os.environ.get("RPC_AVAX", "https://rpc.ankr.com/avalanche"),
-    "arbitrum": os.environ.get("RPC_ARBI", "https://rpc.ankr.com/arbitrum"),
-    "optimism": os.environ.get("RPC_OPT", "https://rpc.ankr.com/optimism"),
-    "fantom": os.environ.get("RPC_FANTOM", "https://rpc.ankr.com/fantom"),
-    "cronos": os.environ.get("RPC_CRONOS", "https://evm.cronos.org"),
-    # Solana uses a different SDK (optional)
-    "solana": os.environ.get("RPC_SOLANA", "https://api.mainnet-beta.solana.com"),
+    "ethereum": os.environ.get("RPC_ETH", PUBLIC_RPC_URLS["ethereum"]),
+    "bsc": os.environ.get("RPC_BSC", PUBLIC_RPC_URLS["bsc"]),
+    "polygon": os.environ.get("RPC_POLYGON", PUBLIC_RPC_URLS["polygon"]),
+    "avax": os.environ.get("RPC_AVAX", PUBLIC_RPC_URLS["avax"]),
+    "arbitrum": os.environ.get("RPC_ARBI", PUBLIC_RPC_URLS["arbitrum"]),
+    "optimism": os.environ.get("RPC_OPT", PUBLIC_RPC_URLS["optimism"]),
+    "fantom": os.environ.get("RPC_FANTOM", PUBLIC_RPC_URLS["fantom"]),
+    "cronos": os.environ.get("RPC_CRONOS", PUBLIC_RPC_URLS["cronos"]),
+    "solana": os.environ.get("RPC_SOLANA", PUBLIC_RPC_URLS["solana"]),
 }
 
-# minimal ERC20 ABI
-ERC20_ABI = [
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "balance", "type": "uint256"}],
-        "type": "function",
-    },
-    {
-        "constant": True,
-        "inputs": [],
-        "name": "decimals",
-        "outputs": [{"name": "", "type": "uint8"}],
-        "type": "function",
-    },
-]
+# ERC20 selectors never change, so calldata is built by hand instead of through web3's ABI encoder
+BALANCEOF_SELECTOR = bytes.fromhex("70a08231")  # balanceOf(address)
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")   # decimals()
+
+# Multicall3 is deployed at the same address on every chain listed in MULTICALL3_CHAINS
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_CHAINS = {"ethereum", "bsc", "polygon", "avax", "arbitrum", "optimism", "fantom"}
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")  # aggregate3((address,bool,bytes)[])
+
+EVM_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
 
 # map coinGecko platform key -> our RPC key (kept intact)
 PLATFORM_TO_CHAIN_KEY = {
@@ -118,12 +167,57 @@ NATIVE_COIN_TO_CHAIN = {
     "solana": "solana",
 }
 
+# reverse lookups, built once (both maps are one-to-one)
+_CHAIN_TO_NATIVE_COIN = {v: k for k, v in NATIVE_COIN_TO_CHAIN.items()}
+_CHAIN_TO_PLATFORM = {ck: pf for pf, ck in PLATFORM_TO_CHAIN_KEY.items()}
+
 # small in-memory caches
-_MARKETS_CACHE: Dict[str, Any] = {}       # key -> (timestamp, data)
-_COIN_DETAIL_CACHE: Dict[str, Any] = {}   # coinId -> (timestamp, data)
 _CACHE_TTL = 12  # seconds for markets, short because frontend refreshes fast
+_COIN_MARKET: TTLCache = TTLCache(maxsize=8192, ttl=_CACHE_TTL)     # coinId -> /coins/markets entry
+_NO_MARKET: Dict[str, Any] = {}  # _COIN_MARKET entry for ids CoinGecko didn't return
+_COIN_DETAIL_CACHE: TTLCache = TTLCache(maxsize=8192, ttl=60)       # coinId -> data
+# sorted id chunk -> (ETag, Last-Modified, entries) of its last 200, kept well past
+# _CACHE_TTL so an expired chunk can be revalidated with a conditional GET
+_MARKET_VALIDATORS: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_CACHE_LOCK = threading.Lock()  # TTLCache isn't thread safe; guards every access
+_TOKEN_INFO_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=600)          # (platform, contract) -> name/symbol/logo
+_TOKEN_PRICE_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=_CACHE_TTL)  # (platform, contract) -> usd/usd_24h_change
+_TOKEN_PRICE_CHUNK = 100  # contract_addresses per /simple/token_price call
+_INFLIGHT: Dict[Tuple[int, Any], threading.Event] = {}  # (cache, key) -> fill in progress
+_CACHE_SWEEP_INTERVAL = 60  # seconds between purges of expired entries
+_SWEEPER_PID: Optional[int] = None
 
-# create Web3 providers lazily and reuse
+# coinId -> {platform: contract} for every CoinGecko coin, from one /coins/list call
+_COIN_PLATFORMS: Dict[str, Dict[str, str]] = {}
+_COIN_PLATFORMS_TTL = 3600
+# "done" is set when the current load ends, so callers can wait out a cold load
+_COIN_PLATFORMS_STATE: Dict[str, Any] = {"ts": 0.0, "refreshing": False, "done": threading.Event()}
+_COIN_PLATFORMS_LOAD_WAIT = 60  # seconds a caller waits for the first load before going without
+_COIN_PLATFORMS_LOCK = threading.Lock()
+
+# one pooled keep-alive session for CoinGecko GETs and raw JSON-RPC POSTs
+# (429s are left to coingecko_get so its own backoff and rate limiter stay in charge)
+_HTTP = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+_HTTP.mount("https://", _HTTP_ADAPTER)
+_HTTP.mount("http://", _HTTP_ADAPTER)
+
+# rate limiting
+_RATE_MAX_WAIT = 20  # seconds a call may queue for a token before giving up
+_CG_MAX_RETRIES = 3
+_CG_MAX_BACKOFF = 10  # cap on a single 429 sleep, even if Retry-After asks for more
+_RATE_LOCK = threading.Lock()
+
+# ERC20 decimals never change for a deployed contract, so no TTL
+_DECIMALS_CACHE: Dict[Tuple[str, str], int] = {}  # (chain, contract lower) -> decimals
+# EIP-55 checksumming hashes the address each time; the set of addresses a server sees is small
+_CHECKSUM_CACHE: Dict[str, str] = {}  # address lower -> checksum address
+
+# one Web3 client per chain, built at import; requests go through the shared _HTTP session
 _WEB3_PROVIDERS: Dict[str, Web3] = {}
 
 # config file state for chains
@@ -142,7 +236,7 @@ def load_chains_from_env_json() -> Dict[str, str]:
     if not cfg:
         return {}
     try:
-        parsed = json.loads(cfg)
+        parsed = orjson.loads(cfg)
         result = {}
         if isinstance(parsed, dict):
             for k, v in parsed.items():
@@ -170,7 +264,7 @@ def load_chains_file(path: str) -> Dict[str, str]:
                 parsed = None
             if parsed is None:
                 try:
-                    parsed = json.loads(raw)
+                    parsed = orjson.loads(raw)
                 except Exception:
                     parsed = None
             if not parsed or not isinstance(parsed, dict):
@@ -209,6 +303,17 @@ def reload_rpc_config_if_changed():
             app.logger.info("No valid chain entries found in %s", _CHAIN_CONFIG_PATH)
         _CHAIN_CONFIG_MTIME = mtime
 
+class PooledHTTPProvider(HTTPProvider):
+    """
+    HTTPProvider that posts through the shared _HTTP session. web3 caches its own sessions
+    per threading.get_ident(), which under gevent is per greenlet, so a session passed to
+    HTTPProvider is only ever used by the greenlet that created the provider.
+    """
+    def make_request(self, method: Any, params: Any) -> Any:
+        r = _HTTP.post(self.endpoint_uri, data=self.encode_rpc_request(method, params), **self.get_request_kwargs())
+        r.raise_for_status()
+        return self.decode_rpc_response(r.content)
+
 def get_web3(chain_key: str) -> Optional[Web3]:
     try:
         reload_rpc_config_if_changed()
@@ -217,72 +322,314 @@ def get_web3(chain_key: str) -> Optional[Web3]:
 
     if chain_key not in RPC_URLS:
         return None
-    if chain_key in _WEB3_PROVIDERS:
-        return _WEB3_PROVIDERS[chain_key]
+    w3 = _WEB3_PROVIDERS.get(chain_key)
+    if w3 is not None and w3.provider.endpoint_uri == RPC_URLS[chain_key]:
+        return w3
+    # first use of a chain added by a config reload, or its RPC url changed
+    return _build_web3(chain_key)
+
+def _build_web3(chain_key: str) -> Optional[Web3]:
     try:
-        provider = HTTPProvider(RPC_URLS[chain_key], request_kwargs={"timeout": 20})
-        w3 = Web3(provider)
+        w3 = Web3(PooledHTTPProvider(RPC_URLS[chain_key], request_kwargs={"timeout": 20}))
         _WEB3_PROVIDERS[chain_key] = w3
         return w3
     except Exception as e:
         app.logger.warning("Failed to create Web3 for %s: %s", chain_key, e)
         return None
 
+def init_web3_providers():
+    """Load chain config and build every EVM chain's client up front, so no request pays for it."""
+    try:
+        reload_rpc_config_if_changed()
+    except Exception:
+        app.logger.warning("Initial chain config load failed (ignored)")
+    for chain_key in RPC_URLS:
+        if chain_key != "solana":
+            _build_web3(chain_key)
+
+init_web3_providers()
+
+# -------------------------
+# Cache helpers
+# -------------------------
+def _sweep_caches():
+    with _CACHE_LOCK:
+        _COIN_MARKET.expire()
+        _COIN_DETAIL_CACHE.expire()
+        _MARKET_VALIDATORS.expire()
+        _TOKEN_INFO_CACHE.expire()
+        _TOKEN_PRICE_CACHE.expire()
+    timer = threading.Timer(_CACHE_SWEEP_INTERVAL, _sweep_caches)
+    timer.daemon = True
+    timer.start()
+
+def _ensure_cache_sweeper():
+    # TTLCache only drops expired entries when written to, so a timer purges them while idle.
+    # Started per process because threads don't survive the gunicorn fork.
+    global _SWEEPER_PID
+    pid = os.getpid()
+    if _SWEEPER_PID == pid:
+        return
+    with _CACHE_LOCK:
+        if _SWEEPER_PID == pid:
+            return
+        _SWEEPER_PID = pid
+    timer = threading.Timer(_CACHE_SWEEP_INTERVAL, _sweep_caches)
+    timer.daemon = True
+    timer.start()
+
+def _single_flight(cache: TTLCache, key: Any, fetch: Callable[[], Any]) -> Any:
+    """
+    Return cache[key], filling it with fetch() on a miss. Concurrent misses for the same key
+    wait for the first caller's fetch instead of all hitting upstream at once.
+    fetch() returns None on failure; failures are not cached.
+    """
+    _ensure_cache_sweeper()
+    flight_key = (id(cache), key)
+    with _CACHE_LOCK:
+        if key in cache:
+            return cache[key]
+        event = _INFLIGHT.get(flight_key)
+        leader = event is None
+        if leader:
+            event = _INFLIGHT[flight_key] = threading.Event()
+    if not leader:
+        event.wait(60)
+        with _CACHE_LOCK:
+            return cache.get(key)
+    try:
+        data = fetch()
+        if data is not None:
+            with _CACHE_LOCK:
+                cache[key] = data
+        return data
+    finally:
+        with _CACHE_LOCK:
+            _INFLIGHT.pop(flight_key, None)
+        event.set()
+
+# -------------------------
+# Rate limiting
+# -------------------------
+class TokenBucket:
+    """
+    Allows `per_minute` calls per minute with bursts up to the same amount.
+    Tokens refill from elapsed time on each call, so no refill thread is needed.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = max(1.0, per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, max_wait: float = _RATE_MAX_WAIT) -> float:
+        """
+        Book one token and return how many seconds to wait before using it.
+        Raises RuntimeError (and hands the token back) if the wait would exceed max_wait.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.ts) * self.rate)
+            self.ts = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            wait = -self.tokens / self.rate
+            if wait > max_wait:
+                self.tokens += 1
+                raise RuntimeError("rate limit budget exhausted (%.1fs wait)" % wait)
+            return wait
+
+    def acquire(self, max_wait: float = _RATE_MAX_WAIT) -> None:
+        wait = self.reserve(max_wait)
+        if wait > 0:
+            time.sleep(wait)
+
+_CG_BUCKET = TokenBucket(COINGECKO_RATE_PER_MIN / RATE_LIMIT_WORKERS)
+_RPC_BUCKETS: Dict[str, TokenBucket] = {}
+
+def rpc_bucket(url: str) -> Optional[TokenBucket]:
+    """Per-host bucket for the built-in public endpoints, None for any other url."""
+    if url.rstrip("/") not in _PUBLIC_RPC_SET:
+        return None
+    host = urlparse(url).netloc
+    with _RATE_LOCK:
+        bucket = _RPC_BUCKETS.get(host)
+        if bucket is None:
+            bucket = _RPC_BUCKETS[host] = TokenBucket(RPC_RATE_PER_MIN / RATE_LIMIT_WORKERS)
+    return bucket
+
+def rpc_throttle(url: str) -> None:
+    bucket = rpc_bucket(url)
+    if bucket is not None:
+        bucket.acquire()
+
+def rpc_reserve(url: str) -> float:
+    """Seconds an async caller should sleep before hitting url (0 for unthrottled urls)."""
+    bucket = rpc_bucket(url)
+    return bucket.reserve() if bucket is not None else 0.0
+
+def coingecko_get(path: str, params: Optional[Dict[str, Any]] = None, timeout: float = 12,
+                  headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """
+    GET COINGECKO_API + path through the shared rate limiter. A 429 is retried up to
+    _CG_MAX_RETRIES times, sleeping for Retry-After or 1s/2s/4s plus jitter.
+    """
+    attempt = 0
+    while True:
+        _CG_BUCKET.acquire()
+        r = _HTTP.get(f"{COINGECKO_API}{path}", params=params, timeout=timeout, headers=headers)
+        if r.status_code != 429 or attempt >= _CG_MAX_RETRIES:
+            return r
+        delay = 2 ** attempt + random.random() * 0.5
+        retry_after = r.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        delay = min(delay, _CG_MAX_BACKOFF)
+        app.logger.warning("CoinGecko 429 on %s, retrying in %.1fs", path, delay)
+        time.sleep(delay)
+        attempt += 1
+
 # -------------------------
 # CoinGecko helpers
 # -------------------------
 def cached_markets(ids: List[str]) -> List[dict]:
+    """
+    /coins/markets entries for ids, cached per coin so overlapping queries share entries.
+    Only ids missing from the cache are fetched, conditionally when the same chunk was
+    fetched before: a 304 re-inserts the stored entries without downloading or parsing.
+    """
     if not ids:
         return []
-    key = ",".join(sorted(ids))
-    now = time.time()
-    entry = _MARKETS_CACHE.get(key)
-    if entry and now - entry["ts"] < _CACHE_TTL:
-        return entry["data"]
-    try:
-        params = {
-            "vs_currency": "usd",
-            "ids": key,
-            "order": "market_cap_desc",
-            "per_page": len(ids),
-            "page": 1,
-            "sparkline": "false",
-            "price_change_percentage": "24h",
-        }
-        r = requests.get(f"{COINGECKO_API}/coins/markets", params=params, timeout=12)
-        r.raise_for_status()
-        data = r.json()
-        _MARKETS_CACHE[key] = {"ts": now, "data": data}
-        return data
-    except Exception as e:
-        app.logger.warning("CoinGecko markets fetch failed for %s: %s", key, e)
-        return []
+    ids = list(dict.fromkeys(ids))
+    with _CACHE_LOCK:
+        missing = sorted(i for i in ids if i not in _COIN_MARKET)
+
+    def fetch():
+        for i in range(0, len(missing), COINGECKO_MAX_IDS):
+            chunk = missing[i:i + COINGECKO_MAX_IDS]
+            try:
+                params = {
+                    "vs_currency": "usd",
+                    "ids": ",".join(chunk),
+                    "order": "market_cap_desc",
+                    "per_page": len(chunk),
+                    "page": 1,
+                    "sparkline": "false",
+                    "price_change_percentage": "24h",
+                }
+                key = tuple(chunk)
+                with _CACHE_LOCK:
+                    prev = _MARKET_VALIDATORS.get(key)
+                headers = {}
+                if prev:
+                    if prev[0]:
+                        headers["If-None-Match"] = prev[0]
+                    if prev[1]:
+                        headers["If-Modified-Since"] = prev[1]
+                r = coingecko_get("/coins/markets", params=params, timeout=12, headers=headers)
+                if r.status_code == 304 and prev:
+                    data = prev[2]
+                    with _CACHE_LOCK:
+                        _MARKET_VALIDATORS[key] = prev  # still current; keep it for the next revalidation
+                else:
+                    r.raise_for_status()
+                    data = orjson.loads(r.content)
+                    etag, modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+                    if etag or modified:
+                        with _CACHE_LOCK:
+                            _MARKET_VALIDATORS[key] = (etag, modified, data)
+            except Exception as e:
+                app.logger.warning("CoinGecko markets fetch failed for %s: %s", ",".join(chunk), e)
+                continue
+            with _CACHE_LOCK:
+                for m in data:
+                    if m.get("id"):
+                        _COIN_MARKET[m["id"]] = m
+                # unknown or delisted ids: remember the miss so polling doesn't refetch them
+                for cid in chunk:
+                    if cid not in _COIN_MARKET:
+                        _COIN_MARKET[cid] = _NO_MARKET
+        # entries are stored per coin above; nothing to keep under the flight key itself
+        return None
+
+    if missing:
+        _single_flight(_COIN_MARKET, ("markets",) + tuple(missing), fetch)
+    with _CACHE_LOCK:
+        found = [_COIN_MARKET[i] for i in ids if _COIN_MARKET.get(i, _NO_MARKET) is not _NO_MARKET]
+    return sorted(found, key=lambda m: -(m.get("market_cap") or 0))
 
 def cached_coin_detail(coin_id: str) -> Optional[dict]:
-    now = time.time()
-    entry = _COIN_DETAIL_CACHE.get(coin_id)
-    if entry and now - entry["ts"] < 60:
-        return entry["data"]
+    def fetch():
+        try:
+            r = coingecko_get(
+                f"/coins/{coin_id}",
+                params={"localization": "false", "tickers": "false", "market_data": "false",
+                        "community_data": "false", "developer_data": "false", "sparkline": "false"},
+                timeout=12
+            )
+            if r.status_code == 404:
+                return {}  # not a CoinGecko id; cache the miss so the warm-up and lookup don't both refetch
+            r.raise_for_status()
+            detail = orjson.loads(r.content)
+            if not isinstance(detail, dict):
+                raise ValueError("unexpected /coins/{id} body")
+            return detail
+        except Exception as e:
+            app.logger.warning("CoinGecko coin detail failed for %s: %s", coin_id, e)
+            return None
+
+    return _single_flight(_COIN_DETAIL_CACHE, coin_id, fetch)
+
+def refresh_coin_platforms() -> None:
+    global _COIN_PLATFORMS
     try:
-        r = requests.get(
-            f"{COINGECKO_API}/coins/{coin_id}",
-            params={"localization": "false", "tickers": "false", "market_data": "false",
-                    "community_data": "false", "developer_data": "false", "sparkline": "false"},
-            timeout=12
-        )
+        r = coingecko_get("/coins/list", params={"include_platform": "true"}, timeout=30)
         r.raise_for_status()
-        data = r.json()
-        _COIN_DETAIL_CACHE[coin_id] = {"ts": now, "data": data}
-        return data
+        table = {c["id"]: (c.get("platforms") or {}) for c in orjson.loads(r.content) if isinstance(c, dict) and c.get("id")}
+        if table:
+            _COIN_PLATFORMS = table
+            _COIN_PLATFORMS_STATE["ts"] = time.time()
     except Exception as e:
-        app.logger.warning("CoinGecko coin detail failed for %s: %s", coin_id, e)
-        return None
+        app.logger.warning("CoinGecko coins list fetch failed: %s", e)
+        # retry in a minute rather than on every lookup
+        _COIN_PLATFORMS_STATE["ts"] = time.time() - _COIN_PLATFORMS_TTL + 60
+    finally:
+        _COIN_PLATFORMS_STATE["refreshing"] = False
+        _COIN_PLATFORMS_STATE["done"].set()
+
+def coin_platforms(coin_id: str) -> Optional[Dict[str, str]]:
+    """
+    Platform map for coin_id from the in-memory coins list, or None if the table doesn't know it.
+    The table is loaded on first use and refreshed in the background once it is an hour old.
+    Callers arriving during the first load wait for it rather than falling back to /coins/{id}.
+    """
+    with _COIN_PLATFORMS_LOCK:
+        start = (not _COIN_PLATFORMS_STATE["refreshing"]
+                 and time.time() - _COIN_PLATFORMS_STATE["ts"] >= _COIN_PLATFORMS_TTL)
+        if start:
+            _COIN_PLATFORMS_STATE["refreshing"] = True
+            _COIN_PLATFORMS_STATE["done"] = threading.Event()
+        loading = _COIN_PLATFORMS_STATE["refreshing"]
+        done = _COIN_PLATFORMS_STATE["done"]
+    if start:
+        if _COIN_PLATFORMS:
+            gevent.spawn(refresh_coin_platforms)
+        else:
+            refresh_coin_platforms()
+    elif loading and not _COIN_PLATFORMS:
+        done.wait(_COIN_PLATFORMS_LOAD_WAIT)
+    return _COIN_PLATFORMS.get(coin_id)
 
 def find_contract_for_coin_id(coin_id: str) -> Optional[Dict[str, str]]:
-    detail = cached_coin_detail(coin_id)
-    if not detail:
-        return None
-    platforms = detail.get("platforms") or {}
+    platforms = coin_platforms(coin_id)
+    if platforms is None:
+        detail = cached_coin_detail(coin_id)
+        if not detail:
+            return None
+        platforms = detail.get("platforms") or {}
     prefer = ["ethereum", "binance-smart-chain", "polygon-pos", "avalanche", "arbitrum-one", "optimistic-ethereum"]
     for p in prefer:
         val = platforms.get(p)
@@ -293,17 +640,101 @@ def find_contract_for_coin_id(coin_id: str) -> Optional[Dict[str, str]]:
             return {"contract": val, "platform": p}
     return None
 
+def _contract_key(platform: str, contract: str) -> str:
+    # EVM addresses are case-insensitive (CoinGecko answers them lowercased); Solana mints are
+    # case-sensitive base58 and must be sent and keyed as given
+    return contract if platform == "solana" else contract.lower()
+
+def cached_token_info(platform: str, contract: str) -> Dict[str, Any]:
+    """
+    Name/symbol/logo for a token contract from CoinGecko /coins/{platform}/contract/{addr}.
+    The price in that response seeds _TOKEN_PRICE_CACHE so a cold lookup needs no extra call.
+    Returns {} when unknown or on failure.
+    """
+    key = (platform, _contract_key(platform, contract))
+
+    def fetch():
+        try:
+            r = coingecko_get(f"/coins/{platform}/contract/{contract}", timeout=10)
+            if r.status_code == 404:
+                return {}  # not listed; cache the miss too
+            r.raise_for_status()
+            info = orjson.loads(r.content)
+            market = info.get("market_data") or {}
+            usd = (market.get("current_price") or {}).get("usd")
+            result = {
+                "name": info.get("name"),
+                "symbol": info.get("symbol"),
+                "logo": (info.get("image") or {}).get("small"),
+            }
+        except Exception as e:
+            app.logger.warning("CoinGecko contract lookup failed for %s on %s: %s", contract, platform, e)
+            return None
+        if usd is not None:
+            with _CACHE_LOCK:
+                _TOKEN_PRICE_CACHE[key] = {"usd": usd, "usd_24h_change": market.get("price_change_percentage_24h")}
+        return result
+
+    return _single_flight(_TOKEN_INFO_CACHE, key, fetch) or {}
+
+def cached_token_prices(platform: str, contracts: List[str]) -> Dict[str, dict]:
+    """
+    USD price + 24h change for many contracts on one platform, keyed by _contract_key.
+    Cache misses are fetched with /simple/token_price in chunks of _TOKEN_PRICE_CHUNK addresses.
+    Contracts CoinGecko has no price for are cached as {} and left out of the result.
+    """
+    out: Dict[str, dict] = {}
+    missing = []
+    with _CACHE_LOCK:
+        for c in dict.fromkeys(_contract_key(platform, c) for c in contracts):
+            entry = _TOKEN_PRICE_CACHE.get((platform, c))
+            if entry is None:
+                missing.append(c)
+            elif entry:
+                out[c] = entry
+    for i in range(0, len(missing), _TOKEN_PRICE_CHUNK):
+        chunk = missing[i:i + _TOKEN_PRICE_CHUNK]
+        try:
+            r = coingecko_get(
+                f"/simple/token_price/{platform}",
+                params={"contract_addresses": ",".join(chunk), "vs_currencies": "usd", "include_24hr_change": "true"},
+                timeout=10
+            )
+            r.raise_for_status()
+            data = orjson.loads(r.content) or {}
+            if not isinstance(data, dict):
+                raise ValueError("unexpected /simple/token_price body")
+        except Exception as e:
+            app.logger.warning("CoinGecko token price fetch failed on %s: %s", platform, e)
+            continue
+        with _CACHE_LOCK:
+            for c in chunk:
+                entry = data.get(c)
+                if not isinstance(entry, dict):
+                    entry = {}
+                _TOKEN_PRICE_CACHE[(platform, c)] = entry  # {} caches the miss too
+                if entry:
+                    out[c] = entry
+    return out
+
 # -------------------------
 # Balance helpers
 # -------------------------
+def _checksum(address: str) -> str:
+    key = address.lower()
+    checksum = _CHECKSUM_CACHE.get(key)
+    if checksum is None:
+        checksum = _CHECKSUM_CACHE[key] = Web3.to_checksum_address(address)
+    return checksum
+
 def get_native_evm_balance(chain_key: str, address: str) -> Optional[float]:
     w3 = get_web3(chain_key)
     if w3 is None:
         return None
     try:
-        checksum = Web3.toChecksumAddress(address)
-        bal_wei = w3.eth.get_balance(checksum)
-        return float(w3.fromWei(bal_wei, "ether"))
+        rpc_throttle(RPC_URLS[chain_key])
+        bal_wei = w3.eth.get_balance(_checksum(address))
+        return float(Web3.from_wei(bal_wei, "ether"))
     except Exception as e:
         app.logger.warning("native balance error for %s @ %s: %s", chain_key, address, e)
         return None
@@ -313,15 +744,12 @@ def get_erc20_balance(chain_key: str, contract_address: str, address: str) -> Op
     if w3 is None:
         return None
     try:
-        checksum_token = Web3.toChecksumAddress(contract_address)
-        checksum_addr = Web3.toChecksumAddress(address)
-        token = w3.eth.contract(address=checksum_token, abi=ERC20_ABI)
-        try:
-            decimals = token.functions.decimals().call()
-        except Exception:
-            decimals = 18
-        raw = token.functions.balanceOf(checksum_addr).call()
-        return float(raw) / (10 ** decimals)
+        rpc_throttle(RPC_URLS[chain_key])
+        raw = w3.eth.call({"to": _checksum(contract_address), "data": "0x" + erc20_balance_calldata(address).hex()})
+        if len(raw) < 32:
+            raise BadFunctionCallOutput("empty balanceOf result from %s" % contract_address)
+        decimals = get_erc20_decimals(chain_key, contract_address)
+        return int.from_bytes(raw[:32], "big") / (10 ** decimals)
     except (BadFunctionCallOutput, ContractLogicError) as e:
         app.logger.warning("erc20 contract call failed: %s", e)
         return None
@@ -329,6 +757,202 @@ def get_erc20_balance(chain_key: str, contract_address: str, address: str) -> Op
         app.logger.warning("erc20 balance error for %s on %s: %s", contract_address, chain_key, e)
         return None
 
+def gmap(fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """
+    fn over items, one greenlet each, results in input order. Under the gevent workers this is
+    the I/O fan-out: greenlets are cheap, so only the rate limiters bound outbound concurrency.
+    """
+    return Group().map(fn, items)
+
+def _rpc_post(url: str, payload: Any) -> Any:
+    """POST a JSON-RPC payload (single or batch) through the rate limiter and pooled session."""
+    rpc_throttle(url)
+    r = _HTTP.post(url, data=orjson.dumps(payload), headers={"Content-Type": "application/json"}, timeout=20)
+    r.raise_for_status()
+    return orjson.loads(r.content)
+
+def native_balances(chains_addresses: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[float]]:
+    """
+    Native EVM balances for several (chain, address) pairs. Each chain has its own RPC URL so
+    the eth_getBalance POSTs can't share a batch; they run concurrently instead.
+    """
+    def fetch(pair: Tuple[str, str]) -> Optional[float]:
+        chain_key, address = pair
+        url = RPC_URLS.get(chain_key)
+        if not url or chain_key == "solana":
+            return None
+        try:
+            payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_getBalance", "params": [address, "latest"]}
+            return int(_rpc_post(url, payload)["result"], 16) / 1e18
+        except Exception as e:
+            app.logger.warning("native balance error for %s @ %s: %s", chain_key, address, e)
+            return None
+
+    pairs = list(dict.fromkeys(chains_addresses))
+    return dict(zip(pairs, gmap(fetch, pairs)))
+
+def get_erc20_decimals(chain_key: str, contract_address: str) -> int:
+    key = (chain_key, contract_address.lower())
+    if key in _DECIMALS_CACHE:
+        return _DECIMALS_CACHE[key]
+    w3 = get_web3(chain_key)
+    if w3 is None:
+        return 18
+    try:
+        rpc_throttle(RPC_URLS[chain_key])
+        raw = w3.eth.call({"to": _checksum(contract_address), "data": "0x" + DECIMALS_SELECTOR.hex()})
+    except Exception:
+        # don't cache failures, the RPC may just be flaky
+        return 18
+    _store_decimals(chain_key, contract_address, raw)
+    return _DECIMALS_CACHE.get(key, 18)
+
+def _store_decimals(chain_key: str, contract_address: str, raw: bytes) -> None:
+    # decimals() returned as a 32-byte word; ignore anything that isn't a sane uint8
+    if len(raw) >= 32:
+        decimals = int.from_bytes(raw[:32], "big")
+        if decimals <= 255:
+            _DECIMALS_CACHE[(chain_key, contract_address.lower())] = decimals
+
+def erc20_balance_calldata(owner: str) -> bytes:
+    """
+    balanceOf(address) selector + owner left-padded to 32 bytes.
+    Identical for every token, so callers build it once per owner.
+    """
+    owner_bytes = bytes.fromhex(owner.lower().replace("0x", ""))
+    if len(owner_bytes) != 20:
+        raise ValueError("invalid owner address")
+    return BALANCEOF_SELECTOR + owner_bytes.rjust(32, b"\x00")
+
+def _multicall_plan(chain_key: str, tokens: List[str], calldata: bytes) -> Tuple[bytes, List[str]]:
+    """
+    aggregate3 calldata reading balanceOf (the same calldata blob for every token) plus
+    decimals() for tokens not in _DECIMALS_CACHE. Returns (calldata, cold tokens).
+    """
+    cold = [t for t in tokens if (chain_key, t.lower()) not in _DECIMALS_CACHE]
+    calls = [(_checksum(t), True, calldata) for t in tokens]
+    calls += [(_checksum(t), True, DECIMALS_SELECTOR) for t in cold]
+    return AGGREGATE3_SELECTOR + abi_encode(["(address,bool,bytes)[]"], [calls]), cold
+
+def _multicall_decode(chain_key: str, tokens: List[str], cold: List[str], raw: bytes) -> List[Optional[float]]:
+    (replies,) = abi_decode(["(bool,bytes)[]"], raw)
+    if len(replies) != len(tokens) + len(cold):
+        raise ValueError("aggregate3 returned %d results for %d calls" % (len(replies), len(tokens) + len(cold)))
+    for t, (success, rd) in zip(cold, replies[len(tokens):]):
+        if success:
+            _store_decimals(chain_key, t, rd)
+    out: List[Optional[float]] = []
+    for t, (success, rd) in zip(tokens, replies[:len(tokens)]):
+        if not success or len(rd) < 32:
+            out.append(None)
+            continue
+        # decimals() already rode in this call; if it failed, use the default rather than a
+        # blocking eth_call (this also runs inside async_multicall_balances' event loop)
+        out.append(int.from_bytes(rd[:32], "big") / (10 ** _DECIMALS_CACHE.get((chain_key, t.lower()), 18)))
+    return out
+
+def multicall_balances(chain_key: str, tokens: List[str], calldata: bytes) -> Optional[List[Optional[float]]]:
+    """
+    balanceOf for many ERC20 contracts in a single eth_call through Multicall3.aggregate3.
+    calldata is the owner's balanceOf blob, built once and shared by every chain.
+    Returns None when the chain has no Multicall3 or the aggregate call fails, so callers can fall back.
+    decimals() for tokens not in _DECIMALS_CACHE is read in the same aggregate call.
+    """
+    if not tokens:
+        return []
+    url = RPC_URLS.get(chain_key)
+    if chain_key not in MULTICALL3_CHAINS or not url:
+        return None
+    try:
+        data, cold = _multicall_plan(chain_key, tokens, calldata)
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_call",
+                   "params": [{"to": MULTICALL3_ADDRESS, "data": "0x" + data.hex()}, "latest"]}
+        reply = _rpc_post(url, payload)
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        return _multicall_decode(chain_key, tokens, cold, bytes.fromhex(reply["result"][2:]))
+    except Exception as e:
+        app.logger.warning("multicall failed on %s: %s", chain_key, e)
+        return None
+
+def batch_erc20_balances(chain_key: str, contract_addrs: List[str], owner: str) -> List[Optional[float]]:
+    """
+    balanceOf(owner) for many ERC20 contracts on one chain using a single JSON-RPC batch POST.
+    decimals() for contracts not in _DECIMALS_CACHE rides in the same batch.
+    Falls back to one get_erc20_balance call per contract if the endpoint rejects the batch.
+    Result list is aligned with contract_addrs.
+    """
+    if not contract_addrs:
+        return []
+    url = RPC_URLS.get(chain_key)
+    if not url or chain_key == "solana":
+        return [None] * len(contract_addrs)
+    try:
+        calldata = "0x" + erc20_balance_calldata(owner).hex()
+        decimals_calldata = "0x" + DECIMALS_SELECTOR.hex()
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "eth_call", "params": [{"to": c, "data": calldata}, "latest"]}
+            for i, c in enumerate(contract_addrs)
+        ]
+        n = len(contract_addrs)
+        cold = [c for c in contract_addrs if (chain_key, c.lower()) not in _DECIMALS_CACHE]
+        batch += [
+            {"jsonrpc": "2.0", "id": n + j, "method": "eth_call", "params": [{"to": c, "data": decimals_calldata}, "latest"]}
+            for j, c in enumerate(cold)
+        ]
+        replies = _rpc_post(url, batch)
+        if not isinstance(replies, list) or any(not isinstance(rep, dict) for rep in replies):
+            raise ValueError("batch eth_call rejected")
+        results = {rep.get("id"): rep for rep in replies}
+        # a token without decimals() just keeps the default, only balanceOf errors reject the batch
+        for j, c in enumerate(cold):
+            raw = (results.get(n + j) or {}).get("result")
+            if raw and raw != "0x":
+                _store_decimals(chain_key, c, bytes.fromhex(raw[2:].rjust(64, "0")))
+        out: List[Optional[float]] = []
+        for i, c in enumerate(contract_addrs):
+            if i not in results or "error" in results[i]:
+                raise ValueError("batch reply missing or failed for id %d" % i)
+            raw = results[i].get("result")
+            if not raw or raw == "0x":
+                # no code at that address
+                out.append(None)
+                continue
+            out.append(int(raw, 16) / (10 ** _DECIMALS_CACHE.get((chain_key, c.lower()), 18)))
+        return out
+    except Exception as e:
+        app.logger.warning("batch eth_call failed on %s, falling back to single calls: %s", chain_key, e)
+        return [get_erc20_balance(chain_key, c, owner) for c in contract_addrs]
+
+def fetch_token_balances(pairs: List[Tuple[str, str]], owner: str) -> Dict[Tuple[str, str], Optional[float]]:
+    """
+    Group (chain_key, contract) pairs by chain and fetch each chain's balances in one call:
+    Multicall3 where available, JSON-RPC batch otherwise. Chains are fetched concurrently.
+    """
+    by_chain: Dict[str, List[str]] = {}
+    for chain_key, contract in pairs:
+        contracts = by_chain.setdefault(chain_key, [])
+        if contract not in contracts:
+            contracts.append(contract)
+
+    try:
+        calldata = erc20_balance_calldata(owner)  # built once, reused for every chain
+    except ValueError:
+        calldata = None
+
+    def fetch_chain(chain_key: str) -> List[Optional[float]]:
+        bals = multicall_balances(chain_key, by_chain[chain_key], calldata) if calldata else None
+        if bals is None:
+            bals = batch_erc20_balances(chain_key, by_chain[chain_key], owner)
+        return bals
+
+    chain_keys = list(by_chain)
+    out: Dict[Tuple[str, str], Optional[float]] = {}
+    for chain_key, bals in zip(chain_keys, gmap(fetch_chain, chain_keys)):
+        for contract, bal in zip(by_chain[chain_key], bals):
+            out[(chain_key, contract)] = bal
+    return out
+
 def get_solana_balance(address: str) -> Optional[float]:
     if not SOLANA_AVAILABLE:
         return None
@@ -346,9 +970,25 @@ def get_solana_balance(address: str) -> Optional[float]:
 # -------------------------
 # Core: compute balance helper (refactored so both endpoints can reuse)
 # -------------------------
-def compute_balance_for_chain(chain: str, address: str, coin_ids: List[str], tokens: List[Dict[str, Any]]):
+def is_valid_address(chain: str, address: str) -> bool:
+    """Cheap format check so junk input is rejected before any CoinGecko or RPC call."""
+    if not isinstance(address, str):
+        return False
+    if chain == "solana":
+        if not SOLANA_AVAILABLE:
+            return True  # no SDK to validate with; get_solana_balance returns None anyway
+        try:
+            PublicKey(address)
+            return True
+        except Exception:
+            return False
+    return EVM_ADDRESS_RE.fullmatch(address) is not None
+
+def compute_balance_for_chain(chain: str, address: str, coin_ids: List[str], tokens: List[Dict[str, Any]],
+                              native_balance: Optional[float] = None):
     """
     Compute result similar to your /api/balance endpoint, but as a function.
+    native_balance: already fetched native balance (multi endpoint prefetches them concurrently).
     """
     result = {
         "chain": chain,
@@ -357,15 +997,19 @@ def compute_balance_for_chain(chain: str, address: str, coin_ids: List[str], tok
         "tokens": [],
         "errors": []
     }
+    if chain not in RPC_URLS:
+        result["errors"].append(f"unsupported_chain: {chain}")
+        result["total_usd"] = 0.0
+        return result
+    if not is_valid_address(chain, address):
+        result["errors"].append(f"invalid_address: {address}")
+        result["total_usd"] = 0.0
+        return result
 
     try:
-        if chain in RPC_URLS and chain != "solana":
-            native_bal = get_native_evm_balance(chain, address)
-            native_coin_id = None
-            for cid, ch in NATIVE_COIN_TO_CHAIN.items():
-                if ch == chain:
-                    native_coin_id = cid
-                    break
+        if chain != "solana":
+            native_bal = native_balance if native_balance is not None else get_native_evm_balance(chain, address)
+            native_coin_id = _CHAIN_TO_NATIVE_COIN.get(chain)
             price = None
             price_change = None
             if native_coin_id:
@@ -381,7 +1025,7 @@ def compute_balance_for_chain(chain: str, address: str, coin_ids: List[str], tok
                 "usd_value": (native_bal or 0) * (price or 0),
                 "price_change_24h": price_change
             }
-        elif chain == "solana":
+        else:
             sol_bal = get_solana_balance(address)
             price = None
             m = cached_markets(["solana"])
@@ -394,8 +1038,6 @@ def compute_balance_for_chain(chain: str, address: str, coin_ids: List[str], tok
                 "usd_value": (sol_bal or 0) * (price or 0),
                 "price_change_24h": m[0].get("price_change_percentage_24h") if m else None
             }
-        else:
-            result["native"] = {"symbol": chain.upper(), "balance": 0.0, "usd_price": None, "usd_value": 0.0}
     except Exception as e:
         app.logger.exception("native balance fetch failed")
         result["errors"].append(f"native_balance_error: {str(e)}")
@@ -409,17 +1051,38 @@ def compute_balance_for_chain(chain: str, address: str, coin_ids: List[str], tok
             if m.get("id"):
                 markets[m["id"]] = m
 
-    for coin_id in coin_ids:
-        if coin_id in NATIVE_COIN_TO_CHAIN and NATIVE_COIN_TO_CHAIN[coin_id] == chain:
+    # resolve contracts first so all balanceOf calls can be batched per chain
+    lookup_ids = [cid for cid in coin_ids if NATIVE_COIN_TO_CHAIN.get(cid) != chain]
+    # the /coins/list table answers most ids from memory; ids it doesn't know need a
+    # /coins/{id} detail fetch, so warm those concurrently before resolving
+    to_fetch = [cid for cid in lookup_ids if coin_platforms(cid) is None]
+    with _CACHE_LOCK:
+        to_fetch = [cid for cid in to_fetch if cid not in _COIN_DETAIL_CACHE]
+    if to_fetch:
+        gmap(cached_coin_detail, to_fetch)
+    resolved = [(cid, find_contract_for_coin_id(cid)) for cid in lookup_ids]
+
+    pairs = []
+    for coin_id, found in resolved:
+        if found and found.get("contract"):
+            chain_key = PLATFORM_TO_CHAIN_KEY.get(found.get("platform"))
+            if chain_key and chain_key in RPC_URLS:
+                pairs.append((chain_key, found.get("contract")))
+    for t in tokens or []:
+        if not isinstance(t, dict):
             continue
-        found = find_contract_for_coin_id(coin_id)
+        tchain, tcontract = t.get("chain") or chain, t.get("contract")
+        # malformed entries are skipped here and reported as token_error below
+        if isinstance(tchain, str) and isinstance(tcontract, str) and tcontract:
+            pairs.append((tchain, tcontract))
+    balances = fetch_token_balances(pairs, address) if pairs else {}
+
+    for coin_id, found in resolved:
         if found and found.get("contract"):
             platform = found.get("platform")
             chain_key = PLATFORM_TO_CHAIN_KEY.get(platform)
             contract_addr = found.get("contract")
-            balance = None
-            if chain_key and chain_key in RPC_URLS:
-                balance = get_erc20_balance(chain_key, contract_addr, address)
+            balance = balances.get((chain_key, contract_addr))
             m = markets.get(coin_id) or {}
             usd_price = float(m.get("current_price", 0) or 0)
             price_chg = m.get("price_change_percentage_24h")
@@ -453,37 +1116,38 @@ def compute_balance_for_chain(chain: str, address: str, coin_ids: List[str], tok
                 "logo": m.get("image") if m else None
             })
 
-    # explicit tokens list
-    for t in tokens or []:
+    # explicit tokens list: metadata is cached (cold lookups run concurrently), prices are batched per platform
+    token_list = list(tokens or [])
+    lookups = []
+    for t in token_list:
+        tchain = (t.get("chain") or chain) if isinstance(t, dict) else None
+        tcontract = t.get("contract") if isinstance(t, dict) else None
+        platform = (_CHAIN_TO_PLATFORM.get(tchain)
+                    if isinstance(tchain, str) and isinstance(tcontract, str) and tcontract else None)
+        lookups.append((platform, tcontract))
+    infos = gmap(lambda lk: cached_token_info(*lk) if lk[0] else {}, lookups)
+    by_platform: Dict[str, List[str]] = {}
+    for platform, tcontract in lookups:
+        if platform:
+            by_platform.setdefault(platform, []).append(tcontract)
+    prices: Dict[Tuple[str, str], dict] = {}
+    platforms = list(by_platform)
+    for platform, found_prices in zip(platforms, gmap(lambda pf: cached_token_prices(pf, by_platform[pf]), platforms)):
+        for c, entry in found_prices.items():
+            prices[(platform, c)] = entry
+    for t, info, (platform, _) in zip(token_list, infos, lookups):
         try:
             tchain = t.get("chain") or chain
             tcontract = t.get("contract")
             if not tcontract:
                 continue
-            balance = get_erc20_balance(tchain, tcontract, address)
-            usd_price = None
-            price_chg = None
-            logo = None
-            coin_name = None
-            coin_symbol = None
-            try:
-                platform_for_cg = None
-                for pf, ck in PLATFORM_TO_CHAIN_KEY.items():
-                    if ck == tchain:
-                        platform_for_cg = pf
-                        break
-                if platform_for_cg:
-                    r = requests.get(f"{COINGECKO_API}/coins/{platform_for_cg}/contract/{tcontract}", timeout=10)
-                    if r.ok:
-                        info = r.json()
-                        market = info.get("market_data") or {}
-                        usd_price = (market.get("current_price") or {}).get("usd")
-                        price_chg = market.get("price_change_percentage_24h")
-                        coin_name = info.get("name")
-                        coin_symbol = info.get("symbol")
-                        logo = (info.get("image") or {}).get("small")
-            except Exception:
-                pass
+            balance = balances.get((tchain, tcontract))
+            price = (prices.get((platform, _contract_key(platform, tcontract))) or {}) if platform else {}
+            usd_price = price.get("usd")
+            price_chg = price.get("usd_24h_change")
+            coin_name = info.get("name")
+            coin_symbol = info.get("symbol")
+            logo = info.get("logo")
 
             result["tokens"].append({
                 "coin_id": None,
@@ -534,9 +1198,10 @@ def api_coins_search():
     if not q:
         return jsonify({"error": "q parameter required"}), 400
     try:
-        r = requests.get(f"{COINGECKO_API}/search", params={"query": q}, timeout=10)
+        r = coingecko_get("/search", params={"query": q}, timeout=10)
         r.raise_for_status()
-        return jsonify(r.json())
+        # pass CoinGecko's JSON through untouched instead of parsing and re-encoding it
+        return app.response_class(r.content, mimetype="application/json")
     except Exception as e:
         app.logger.exception("CoinGecko search failed")
         return jsonify({"error": "search failed", "detail": str(e)}), 500
@@ -579,24 +1244,31 @@ def api_balance_multi():
         return jsonify({"error": "addresses mapping required"}), 400
 
     out = {}
+    natives = native_balances([
+        (chain_key.lower(), addr) for chain_key, addr in addresses.items()
+        if chain_key.lower() in RPC_URLS and chain_key.lower() != "solana" and is_valid_address(chain_key.lower(), addr)
+    ])
+    jobs = []
     for chain_key, addr in addresses.items():
+        if not addr:
+            out[chain_key] = {"error": "address empty"}
+            continue
+        jobs.append((chain_key, addr))
+
+    def compute(job: Tuple[str, Any]) -> Dict[str, Any]:
+        chain_key, addr = job
         try:
-            if not addr:
-                out[chain_key] = {"error": "address empty"}
-                continue
             # For per-chain tokens you could accept payload["tokens_by_chain"], but we reuse global tokens
-            res = compute_balance_for_chain(chain_key.lower(), addr, coin_ids, tokens)
-            out[chain_key] = res
+            native = natives.get((chain_key.lower(), addr)) if isinstance(addr, str) else None
+            return compute_balance_for_chain(chain_key.lower(), addr, coin_ids, tokens, native)
         except Exception as e:
             app.logger.exception("multi balance compute failed for %s", chain_key)
-            out[chain_key] = {"error": str(e)}
+            return {"error": str(e)}
+
+    for (chain_key, _), res in zip(jobs, gmap(compute, jobs)):
+        out[chain_key] = res
     return jsonify(out)
 
 if __name__ == "__main__":
-    # try initial chain config load
-    try:
-        reload_rpc_config_if_changed()
-    except Exception:
-        app.logger.warning("Initial chain config load failed (ignored)")
     app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 5000)), debug=True)
 
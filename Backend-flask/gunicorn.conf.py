@@ -1,5 +1,12 @@
+import os
+
 bind = "0.0.0.0:8000"   # listen on all IPs, port 8000
-workers = 4             # number of worker processes
-threads = 2             # threads per worker
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))  # number of worker processes
+worker_class = "gevent" # requests are mostly waiting on RPC/CoinGecko I/O
+worker_connections = 1000  # concurrent greenlets per worker
 timeout = 120           # kill workers if they hang > 120s
-preload_app = True      # load app before workers are forked
\ No newline at end of file
+preload_app = True      # load app before workers are forked
+raw_env = [
+    f"LOG_LEVEL={os.environ.get('LOG_LEVEL', 'WARNING')}",  # skip per-request INFO logs in production
+    f"WEB_CONCURRENCY={workers}",  # app.py splits its rate budgets across the workers
+]
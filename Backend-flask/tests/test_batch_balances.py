@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402  (app monkey-patches the stdlib, so it is imported first)
+
+OWNER = "0x" + "ab" * 20
+TOKENS = ["0x" + "31" * 20, "0x" + "32" * 20]
+
+
+def word(n):
+    return "0x" + n.to_bytes(32, "big").hex()
+
+
+class BatchBalancesTest(unittest.TestCase):
+    def setUp(self):
+        for t in TOKENS:
+            app._DECIMALS_CACHE.pop(("ethereum", t), None)
+        self.single = mock.patch.object(app, "get_erc20_balance", return_value=1.0).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def batch(self, reply):
+        with mock.patch.object(app, "_rpc_post", return_value=reply) as post:
+            out = app.batch_erc20_balances("ethereum", TOKENS, OWNER)
+        return out, post
+
+    def test_batch_reads_balances_and_cold_decimals(self):
+        reply = [
+            {"id": 0, "result": word(5 * 10**6)},
+            {"id": 1, "result": word(7 * 10**18)},
+            {"id": 2, "result": word(6)},
+            {"id": 3, "result": "0x"},
+        ]
+        out, post = self.batch(reply)
+        self.assertEqual(out, [5.0, 7.0])
+        self.assertEqual(len(post.call_args[0][1]), 4)  # 2 balanceOf + 2 cold decimals()
+        self.assertEqual(app._DECIMALS_CACHE[("ethereum", TOKENS[0])], 6)
+        self.assertNotIn(("ethereum", TOKENS[1]), app._DECIMALS_CACHE)
+        self.single.assert_not_called()
+
+    def test_rejected_batch_falls_back_to_single_calls(self):
+        out, _ = self.batch({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}})
+        self.assertEqual(out, [1.0, 1.0])
+        self.assertEqual([c.args for c in self.single.call_args_list], [("ethereum", t, OWNER) for t in TOKENS])
+
+    def test_balance_error_in_batch_falls_back(self):
+        reply = [
+            {"id": 0, "error": {"code": -32000, "message": "execution reverted"}},
+            {"id": 1, "result": word(10**18)},
+        ]
+        out, _ = self.batch(reply)
+        self.assertEqual(out, [1.0, 1.0])
+        self.assertEqual(self.single.call_count, 2)
+
+    def test_empty_result_means_no_contract(self):
+        app._DECIMALS_CACHE[("ethereum", TOKENS[0])] = 18
+        app._DECIMALS_CACHE[("ethereum", TOKENS[1])] = 18
+        out, _ = self.batch([{"id": 0, "result": "0x"}, {"id": 1, "result": word(2 * 10**18)}])
+        self.assertEqual(out, [None, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402  (app monkey-patches the stdlib, so it is imported first)
+import gevent  # noqa: E402
+import orjson  # noqa: E402
+from cachetools import TTLCache  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200, headers=None):
+        self.content = orjson.dumps(body)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError("HTTP %d" % self.status_code)
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_concurrent_misses_share_one_fetch(self):
+        cache = TTLCache(maxsize=16, ttl=60)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            gevent.sleep(0.05)
+            return {"v": 1}
+
+        results = [g.value for g in gevent.joinall(
+            [gevent.spawn(app._single_flight, cache, "k", fetch) for _ in range(5)])]
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"v": 1}] * 5)
+        self.assertEqual(app._single_flight(cache, "k", fetch), {"v": 1})
+        self.assertEqual(len(calls), 1)
+
+    def test_failures_are_not_cached(self):
+        cache = TTLCache(maxsize=16, ttl=60)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return None
+
+        self.assertIsNone(app._single_flight(cache, "k", fetch))
+        self.assertIsNone(app._single_flight(cache, "k", fetch))
+        self.assertEqual(len(calls), 2)
+        self.assertNotIn("k", cache)
+
+
+class CachedMarketsTest(unittest.TestCase):
+    def setUp(self):
+        with app._CACHE_LOCK:
+            app._COIN_MARKET.clear()
+            app._MARKET_VALIDATORS.clear()
+        self.requested = []
+        patcher = mock.patch.object(app, "coingecko_get", self.fake_get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fake_get(self, path, params=None, timeout=12, headers=None):
+        ids = params["ids"].split(",")
+        self.requested.append(ids)
+        caps = {"a": 3, "b": 2, "c": 1}
+        return FakeResponse([{"id": i, "market_cap": caps[i]} for i in ids if i in caps])
+
+    def test_only_missing_ids_are_fetched(self):
+        self.assertEqual([m["id"] for m in app.cached_markets(["a", "b"])], ["a", "b"])
+        self.assertEqual([m["id"] for m in app.cached_markets(["c", "b", "a"])], ["a", "b", "c"])
+        self.assertEqual(self.requested, [["a", "b"], ["c"]])
+
+    def test_ids_coingecko_omits_are_negative_cached(self):
+        for _ in range(3):
+            self.assertEqual([m["id"] for m in app.cached_markets(["a", "nope"])], ["a"])
+        self.assertEqual(self.requested, [["a", "nope"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402  (app monkey-patches the stdlib, so it is imported first)
+from eth_abi import decode, encode  # noqa: E402
+from web3 import Web3  # noqa: E402
+
+OWNER = "0x" + "ab" * 20
+WARM = "0x" + "11" * 20
+COLD = "0x" + "22" * 20
+CHAIN = "test-multicall"
+
+
+class MulticallPlanTest(unittest.TestCase):
+    def setUp(self):
+        app._DECIMALS_CACHE[(CHAIN, WARM)] = 6
+        app._DECIMALS_CACHE.pop((CHAIN, COLD), None)
+
+    def test_plan_encodes_checksummed_aggregate3_calls(self):
+        calldata = app.erc20_balance_calldata(OWNER)
+        data, cold = app._multicall_plan(CHAIN, [WARM, COLD], calldata)
+        self.assertEqual(cold, [COLD])
+        self.assertEqual(data[:4], app.AGGREGATE3_SELECTOR)
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        self.assertEqual([c[0] for c in calls], [Web3.to_checksum_address(a) for a in (WARM, COLD, COLD)])
+        self.assertEqual([c[2] for c in calls], [calldata, calldata, app.DECIMALS_SELECTOR])
+
+    def test_decode_stores_decimals_and_scales_balances(self):
+        replies = [
+            (True, (5 * 10**6).to_bytes(32, "big")),
+            (True, (3 * 10**8).to_bytes(32, "big")),
+            (True, (8).to_bytes(32, "big")),
+        ]
+        raw = encode(["(bool,bytes)[]"], [replies])
+        self.assertEqual(app._multicall_decode(CHAIN, [WARM, COLD], [COLD], raw), [5.0, 3.0])
+        self.assertEqual(app._DECIMALS_CACHE[(CHAIN, COLD)], 8)
+
+    def test_decode_defaults_to_18_decimals_when_decimals_call_failed(self):
+        replies = [
+            (True, (5 * 10**6).to_bytes(32, "big")),
+            (True, (7 * 10**18).to_bytes(32, "big")),
+            (False, b""),
+        ]
+        raw = encode(["(bool,bytes)[]"], [replies])
+        self.assertEqual(app._multicall_decode(CHAIN, [WARM, COLD], [COLD], raw), [5.0, 7.0])
+        self.assertNotIn((CHAIN, COLD), app._DECIMALS_CACHE)
+
+    def test_decode_maps_failed_calls_to_none(self):
+        raw = encode(["(bool,bytes)[]"], [[(False, b""), (True, b"")]])
+        self.assertEqual(app._multicall_decode(CHAIN, [WARM, COLD], [], raw), [None, None])
+
+    def test_decode_rejects_mismatched_result_count(self):
+        raw = encode(["(bool,bytes)[]"], [[(True, (1).to_bytes(32, "big"))]])
+        with self.assertRaises(ValueError):
+            app._multicall_decode(CHAIN, [WARM, COLD], [], raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402  (app monkey-patches the stdlib, so it is imported first)
+
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(app.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bucket = app.TokenBucket(60)  # one token per second, bursts of 60
+
+    def drain(self):
+        for _ in range(60):
+            self.assertEqual(self.bucket.reserve(), 0.0)
+
+    def test_burst_then_wait(self):
+        self.drain()
+        self.assertAlmostEqual(self.bucket.reserve(), 1.0)
+        self.assertAlmostEqual(self.bucket.reserve(), 2.0)
+
+    def test_refills_from_elapsed_time(self):
+        self.drain()
+        self.now += 2.5
+        self.assertEqual(self.bucket.reserve(), 0.0)
+        self.assertEqual(self.bucket.reserve(), 0.0)
+        self.assertAlmostEqual(self.bucket.reserve(), 0.5)
+
+    def test_refill_is_capped_at_capacity(self):
+        self.now += 3600
+        self.drain()
+        self.assertAlmostEqual(self.bucket.reserve(), 1.0)
+
+    def test_over_budget_raises_and_refunds(self):
+        self.drain()
+        with self.assertRaises(RuntimeError):
+            self.bucket.reserve(max_wait=0.5)
+        # the refused token was handed back, so the next caller queues behind nobody
+        self.assertAlmostEqual(self.bucket.reserve(max_wait=5), 1.0)
+
+
+class RpcBucketTest(unittest.TestCase):
+    def test_only_public_endpoints_are_throttled(self):
+        self.assertIsNotNone(app.rpc_bucket(app.PUBLIC_RPC_URLS["ethereum"]))
+        self.assertIsNone(app.rpc_bucket("https://eth-mainnet.example/v2/key"))
+        self.assertEqual(app.rpc_reserve("https://eth-mainnet.example/v2/key"), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()